@@ -9,16 +9,20 @@ from .vars import (
     Var,
     VarData,
     VarDict,
+    compile_to_df,
     dict_to_df,
     records_to_df,
     unpack,
     vars_from_dict,
     vars_to_dict,
+    vars_to_multi_index,
     vars_to_multi_index_data,
 )
 
 __all__ = [
     "Var",
+    "compile_to_df",
+    "vars_to_multi_index",
     "vars_to_multi_index_data",
     "dict_to_df",
     "VarData",
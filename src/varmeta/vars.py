@@ -2,12 +2,165 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any, NotRequired, TypedDict
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from numpy.typing import NDArray
+
+# Hoisted so isinstance checks in hot paths do not rebuild the type
+# union on every call.
+_SCALAR_TYPES = (float, int)
+
+# Known data_type names resolved to type objects, so Var.validate can
+# compare types directly instead of comparing name strings per call.
+# ndarray is deliberately absent so the module does not need NumPy at
+# import time; validate falls back to comparing type names for it.
+_DATA_TYPES: dict[str, type] = {
+    "int": int,
+    "float": float,
+    "complex": complex,
+    "bool": bool,
+    "str": str,
+    "bytes": bytes,
+    "list": list,
+    "tuple": tuple,
+    "dict": dict,
+}
+
+
+def _is_ndarray(obj: object) -> bool:
+    """Check whether obj is an ndarray without importing NumPy.
+
+    If NumPy has not been imported yet, obj cannot be an ndarray, so
+    pure-Python workloads never pay for the import.
+
+    Args:
+        obj (object): The object to check.
+
+    Returns:
+        bool: True if obj is a numpy.ndarray.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
 
-import numpy as np
-import pandas as pd
-from numpy.typing import NDArray
+
+def _is_flat_row(row: object, n_components: int) -> bool:
+    """Check whether row is a flat sequence of one value per component.
+
+    Args:
+        row (object): A single record's value for a componented Var.
+        n_components (int): Number of components of the Var.
+
+    Returns:
+        bool: True if row is a list or tuple of n_components scalars.
+    """
+    return (
+        isinstance(row, (list, tuple))
+        and len(row) == n_components
+        and not any(
+            isinstance(item, (list, tuple)) or _is_ndarray(item)
+            for item in row
+        )
+    )
+
+
+def _unpack_list(
+    data: list,
+    components: tuple[str, ...],
+    component_axis: int,
+) -> list | None:
+    """Unpack a plain list along the component axis without NumPy.
+
+    Args:
+        data (list): The list to unpack.
+        components (tuple[str, ...]): Component names of the Var.
+        component_axis (int): Axis along which the components lie.
+
+    Returns:
+        list | None: One list per component, or None if the layout is
+        not a recognized list shape and the ndarray path should handle
+        it.
+
+    Raises:
+        ValueError: If the list shape does not match the components.
+    """
+    n_components = len(components)
+    first = data[0] if data else None
+    if not isinstance(first, (list, tuple)) and not _is_ndarray(first):
+        # 1-dimensional data, so the axis is irrelevant.
+        if len(data) != n_components:
+            raise ValueError(
+                f"Expected {n_components} component values, got"
+                f" {len(data)}."
+            )
+        return list(data)
+    if isinstance(first, list):
+        if component_axis == 0:
+            if len(data) != n_components:
+                raise ValueError(
+                    f"Expected {n_components} component rows, got"
+                    f" {len(data)}."
+                )
+            if any(len(row) != len(first) for row in data):
+                raise ValueError("Data rows must have equal length.")
+            return list(data)
+        if component_axis == 1:
+            # strict zip rejects ragged rows, as np.asarray would.
+            return [list(col) for col in zip(*data, strict=True)]
+    return None
+
+
+def _unpack_array(
+    data_array: NDArray, component_axis: int
+) -> tuple[NDArray, bool]:
+    """Move the component axis of an array to the front.
+
+    Args:
+        data_array (NDArray): The array to unpack.
+        component_axis (int): Axis along which the components lie.
+
+    Returns:
+        tuple[NDArray, bool]: The array with components along axis 0,
+        and whether an axis move occurred.
+
+    Raises:
+        ValueError: If the array is 0-dimensional or the axis is out of
+            bounds.
+    """
+    if data_array.ndim < 1:
+        raise ValueError("Data must be at least 1-dimensional to unpack.")
+    if data_array.ndim == 1:
+        # Ignore the axis as there's only one dimension
+        return data_array, False
+    if component_axis > data_array.ndim - 1:
+        raise ValueError(
+            f"Component axis {component_axis} is out of bounds for"
+            + " data with {data_array.ndim} dimensions."
+        )
+    if component_axis == 0:
+        # Components already lie along the first axis.
+        return data_array, False
+    if component_axis == 1:
+        # Moving axis 1 to the front is a plain stride swap.
+        return data_array.swapaxes(0, 1), True
+    import numpy as np
+
+    return np.moveaxis(data_array, component_axis, 0), True  # type: ignore
+
+# Shared result for component-less Vars; treat as immutable.
+_NO_COMPONENT_VARS: list[Var] = []
+
+# Interning pool for component Vars. Parents with overlapping component
+# signatures share the same child instances, so repeated unpacks do not
+# churn the allocator. Weak values let unused entries be collected.
+_component_var_pool: WeakValueDictionary[tuple, Var] = WeakValueDictionary()
 
 
 class VarData(TypedDict):
@@ -22,7 +175,7 @@ class VarData(TypedDict):
     data_type: NotRequired[str | None]
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Var:
     """A variable with metadata.
 
@@ -42,6 +195,140 @@ class Var:
     components: tuple[str, ...] | None = None
     component_axis: int = 0
     data_type: str | None = "object"
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
+    _component_vars: list[Var] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _data_type_cls: type | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _desc: str = field(default="", init=False, repr=False, compare=False)
+    _as_dict: VarData | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sort_key: tuple = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Precompute the hash of the compared fields.
+
+        Var instances are frozen and used as dict keys, so the hash is
+        computed once here instead of on every lookup. The data_type
+        name is resolved to a type object at the same time for use in
+        validate, and the identifier strings are interned so dict
+        lookups on them take CPython's pointer-compare fast path.
+        """
+        object.__setattr__(self, "key", sys.intern(self.key))
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "units", sys.intern(self.units))
+        if self.data_type is not None:
+            object.__setattr__(
+                self, "_data_type_cls", _DATA_TYPES.get(self.data_type)
+            )
+        object.__setattr__(self, "_desc", f"{self.name} [{self.units}]")
+        compared = (
+            self.name,
+            self.units,
+            self.description,
+            self.components,
+            self.component_axis,
+            self.data_type,
+        )
+        object.__setattr__(self, "_sort_key", compared)
+        object.__setattr__(self, "_hash", hash(compared))
+
+    def __hash__(self) -> int:
+        """Return the precomputed hash of the variable.
+
+        Returns:
+            int: Hash of the compared fields.
+        """
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality on the compared fields (key is excluded).
+
+        Identity and the precomputed hash are checked first, so
+        interned component Vars and unequal Vars short-circuit before
+        the field-by-field comparison.
+
+        Args:
+            other (object): The object to compare against.
+
+        Returns:
+            bool: True if the compared fields match.
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self._hash != other._hash:
+            return False
+        return (
+            self.name == other.name
+            and self.units == other.units
+            and self.description == other.description
+            and self.components == other.components
+            and self.component_axis == other.component_axis
+            and self.data_type == other.data_type
+        )
+
+    def __lt__(self, other: Var) -> bool:
+        """Order on the precomputed tuple of compared fields.
+
+        Sorting many Vars compares the cached tuples directly instead of
+        rebuilding a field tuple per comparison, as dataclass order=True
+        would.
+
+        Args:
+            other (Var): The Var to compare against.
+
+        Returns:
+            bool: True if this Var orders before other.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key < other._sort_key
+
+    def __le__(self, other: Var) -> bool:
+        """Order on the precomputed tuple of compared fields.
+
+        Args:
+            other (Var): The Var to compare against.
+
+        Returns:
+            bool: True if this Var orders before or equal to other.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key <= other._sort_key
+
+    def __gt__(self, other: Var) -> bool:
+        """Order on the precomputed tuple of compared fields.
+
+        Args:
+            other (Var): The Var to compare against.
+
+        Returns:
+            bool: True if this Var orders after other.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key > other._sort_key
+
+    def __ge__(self, other: Var) -> bool:
+        """Order on the precomputed tuple of compared fields.
+
+        Args:
+            other (Var): The Var to compare against.
+
+        Returns:
+            bool: True if this Var orders after or equal to other.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key >= other._sort_key
 
     def __str__(self) -> str:
         """Return a string representation of the variable.
@@ -49,8 +336,7 @@ class Var:
         Returns:
             str: The variable name and units.
         """
-        desc = f"{self.name} [{self.units}]"
-        return desc
+        return self._desc
 
     def __repr__(self) -> str:
         """Return a string representation of the variable.
@@ -58,24 +344,33 @@ class Var:
         Returns:
             str: The variable name and units.
         """
-        desc = f"{self.name} [{self.units}]"
-        return desc
+        return self._desc
 
     def to_dict(self) -> VarData:
         """Convert the Var to a dictionary.
 
+        The field mapping is built once per instance and cached, since
+        Var is frozen; a fresh shallow copy is returned each call so
+        callers may mutate the result freely.
+
         Returns:
             VarData: Dictionary representation of the Var.
         """
-        return {
-            "key": self.key,
-            "name": self.name,
-            "units": self.units,
-            "description": self.description,
-            "components": self.components,
-            "component_axis": self.component_axis,
-            "data_type": self.data_type,
-        }
+        if self._as_dict is None:
+            object.__setattr__(
+                self,
+                "_as_dict",
+                {
+                    "key": self.key,
+                    "name": self.name,
+                    "units": self.units,
+                    "description": self.description,
+                    "components": self.components,
+                    "component_axis": self.component_axis,
+                    "data_type": self.data_type,
+                },
+            )
+        return dict(self._as_dict)
 
     def validate(self, data: object, raise_type_error: bool = True) -> bool:
         """Validate that the data matches the Var's data_type.
@@ -89,7 +384,13 @@ class Var:
         """
         if self.data_type is None or self.data_type == "object":
             return True
-        if type(data).__name__ != self.data_type:
+        data_type_cls = self._data_type_cls
+        if data_type_cls is not None:
+            matches = type(data) is data_type_cls
+        else:
+            # Unknown type name; fall back to comparing names.
+            matches = type(data).__name__ == self.data_type
+        if not matches:
             if raise_type_error:
                 raise TypeError(f"Expected {self.data_type}, got {type(data)}")
             return False
@@ -98,22 +399,42 @@ class Var:
     def component_vars(self) -> list[Var]:
         """Return a list of component variables.
 
+        The list is built once per instance and cached; Var is frozen,
+        so the result never changes.
+
         Returns:
             list[Var]: List of component Var objects.
         """
         if self.components is None:
-            return []
-        return [
-            Var(
-                key=f"{self.key}_{comp}",
-                name=f"{self.name} - {comp}",
-                units=self.units,
-                description=self.description,
-                components=None,
-                data_type=self.data_type,
-            )
-            for comp in self.components
-        ]
+            return _NO_COMPONENT_VARS
+        if self._component_vars is None:
+            component_vars = []
+            key_prefix = self.key + "_"
+            name_prefix = self.name + " - "
+            for comp in self.components:
+                comp_key = key_prefix + comp
+                comp_name = name_prefix + comp
+                pool_key = (
+                    comp_key,
+                    comp_name,
+                    self.units,
+                    self.description,
+                    self.data_type,
+                )
+                var = _component_var_pool.get(pool_key)
+                if var is None:
+                    var = Var(
+                        key=comp_key,
+                        name=comp_name,
+                        units=self.units,
+                        description=self.description,
+                        components=None,
+                        data_type=self.data_type,
+                    )
+                    _component_var_pool[pool_key] = var
+                component_vars.append(var)
+            object.__setattr__(self, "_component_vars", component_vars)
+        return self._component_vars
 
     def unpack(self, data: object) -> tuple[list[Var], list[object] | NDArray]:
         """Unpack the value into component variables.
@@ -130,23 +451,28 @@ class Var:
         """
         if self.components is None:
             raise ValueError("No components to unpack")
-        if isinstance(data, float | int):
+        if isinstance(data, _SCALAR_TYPES):
             raise ValueError("Values must be iterable")
-        data_array = np.asarray(data)
-        if data_array.ndim < 1:
-            raise ValueError("Data must be at least 1-dimensional to unpack.")
-        if data_array.ndim == 1:
-            # Ignore the axis as there's only one dimension
-            subvals = data_array
-        elif self.component_axis > data_array.ndim - 1:
-            raise ValueError(
-                f"Component axis {self.component_axis} is out of bounds for"
-                + " data with {data_array.ndim} dimensions."
+        if isinstance(data, list):
+            # Fast path: well-formed lists unpack without the
+            # ndarray round-trip that np.asarray + tolist incurs.
+            subvals = _unpack_list(
+                data, self.components, self.component_axis
             )
-        else:
-            subvals = np.moveaxis(data_array, self.component_axis, 0)  # type: ignore
+            if subvals is not None:
+                return self.component_vars(), subvals
+        import numpy as np
+
+        data_array = (
+            data if isinstance(data, np.ndarray) else np.asarray(data)
+        )
+        subvals, moved = _unpack_array(data_array, self.component_axis)
         if not isinstance(data, np.ndarray):
             subvals = subvals.tolist()
+        elif moved and not subvals.flags["C_CONTIGUOUS"]:
+            # Materialize contiguously so downstream consumers stream
+            # each component slice with unit stride.
+            subvals = np.ascontiguousarray(subvals)
         subvars = self.component_vars()
         return subvars, subvals
 
@@ -171,7 +497,13 @@ class Var:
 class VarDict(dict[str, Var]):
     """A dictionary of Var objects with additional utility methods."""
 
-    pass
+    def copy(self) -> VarDict:
+        """Return a shallow copy of the VarDict.
+
+        Returns:
+            VarDict: A new VarDict with the same keys and Var objects.
+        """
+        return type(self)(self)
 
 
 def unpack(
@@ -184,19 +516,22 @@ def unpack(
             - Mapping from var key to Var object (including components).
             - Mapping from var key to unpacked data values.
     """
+    if all(not var_dct[key].components for key in data_dct):
+        # Nothing to expand; copy both mappings in bulk.
+        vars = VarDict((key, var_dct[key]) for key in data_dct)
+        return vars, dict(data_dct)
     vars = VarDict()
     vals = {}
     for key, data in data_dct.items():
         var = var_dct[key]
-        subvars = var.component_vars()
-        if subvars:
-            tuples = var.unpack_tuples(data)
-            for subvar, subval in tuples:
-                vals[subvar.key] = subval
-                vars[subvar.key] = subvar
-        else:
+        if not var.components:
             vals[key] = data
             vars[key] = var
+        else:
+            subvars, subvals = var.unpack(data)
+            for subvar, subval in zip(subvars, subvals, strict=True):
+                vals[subvar.key] = subval
+                vars[subvar.key] = subvar
     return vars, vals
 
 
@@ -215,13 +550,65 @@ def vars_to_multi_index_data(
             - List of variable names.
             - List of variable units.
     """
-    tuples = []
     attrs = ["key", "name", "units"] if attrs is None else attrs
-    for var in lst:
-        tuples.append(tuple([getattr(var, attr) for attr in attrs]))
+    if len(attrs) == 1:
+        # attrgetter returns a bare value for a single name.
+        getter = attrgetter(attrs[0])
+        tuples = [(getter(var),) for var in lst]
+    else:
+        tuples = list(map(attrgetter(*attrs), lst))
     return tuples, attrs
 
 
+@lru_cache(maxsize=128)
+def _multi_index_from_arrays(
+    arrays: tuple[tuple[Any, ...], ...],
+    names: tuple[str, ...],
+) -> pd.MultiIndex:
+    """Build and cache a MultiIndex from per-level value tuples.
+
+    The cache is keyed on the level values themselves, so repeated
+    DataFrame builds over the same schema reuse one immutable index.
+
+    Args:
+        arrays: One tuple of level values per attribute.
+        names: Names for the MultiIndex levels.
+
+    Returns:
+        pd.MultiIndex: MultiIndex with one level per attribute.
+    """
+    import pandas as pd
+
+    return pd.MultiIndex.from_arrays(
+        [list(level) for level in arrays], names=names
+    )
+
+
+def vars_to_multi_index(
+    lst: list[Var],
+    attrs: list[str] | None = None,
+) -> pd.MultiIndex:
+    """Build a pandas MultiIndex from a list of Vars.
+
+    Levels are passed to pd.MultiIndex.from_arrays as one array per
+    attribute, which factorizes each level in a single vectorized pass
+    instead of splitting a list of tuples. The built index is cached
+    per schema, as pandas indexes are immutable.
+
+    Args:
+        lst: List of Var objects.
+        attrs: List of Var attributes to use for MultiIndex levels.
+
+    Returns:
+        pd.MultiIndex: MultiIndex with one level per attribute.
+    """
+    attrs = ["key", "name", "units"] if attrs is None else attrs
+    arrays = tuple(
+        tuple(getattr(var, attr) for var in lst) for attr in attrs
+    )
+    return _multi_index_from_arrays(arrays, tuple(attrs))
+
+
 def dict_to_df(
     var_dct: VarDict,
     data_dct: dict[str, Any],
@@ -237,15 +624,84 @@ def dict_to_df(
     Returns:
         pd.DataFrame: DataFrame with MultiIndex columns based on Var metadata.
     """
+    import pandas as pd
+
     var_dct, data_dct = unpack(var_dct, data_dct)
     var_list = [var_dct[key] for key in data_dct]
-    tuples, names = vars_to_multi_index_data(var_list, attrs=attrs)
-    columns = pd.MultiIndex.from_tuples(tuples, names=names)
+    columns = vars_to_multi_index(var_list, attrs=attrs)
+    values = list(data_dct.values())
+    if values and all(_is_ndarray(value) for value in values):
+        import numpy as np
+
+        if (
+            all(value.ndim == 1 for value in values)
+            and len({value.dtype for value in values}) == 1
+            and len({value.shape for value in values}) == 1
+        ):
+            # Homogeneous 1-D columns consolidate into a single 2-D
+            # block instead of one block per column.
+            return pd.DataFrame(np.column_stack(values), columns=columns)
     df = pd.DataFrame(data_dct)
     df.columns = columns
     return df
 
 
+def compile_to_df(
+    var_dct: VarDict,
+    attrs: list[str] | None = None,
+) -> Callable[[dict[str, Any]], pd.DataFrame]:
+    """Precompile a dict_to_df equivalent for a fixed set of Vars.
+
+    When the same var_dct is used to build many DataFrames, the
+    component expansion and the column MultiIndex depend only on the
+    Vars, not the data. Resolve both once and return a closure that
+    only moves data.
+
+    Args:
+        var_dct: Dictionary mapping var keys to Var objects.
+        attrs: List of Var attributes to use for MultiIndex levels.
+
+    Returns:
+        Callable[[dict[str, Any]], pd.DataFrame]: Function converting a
+        data dict (with exactly the keys of var_dct) to a DataFrame.
+    """
+    plan = list(var_dct.items())
+    expanded: list[Var] = []
+    for _, var in plan:
+        if not var.components:
+            expanded.append(var)
+        else:
+            expanded.extend(var.component_vars())
+    columns = vars_to_multi_index(expanded, attrs=attrs)
+
+    def to_df(data_dct: dict[str, Any]) -> pd.DataFrame:
+        """Convert a data dict to a DataFrame with precompiled columns.
+
+        Args:
+            data_dct: Dictionary mapping var keys to data values.
+
+        Returns:
+            pd.DataFrame: DataFrame with the precompiled MultiIndex
+            columns.
+        """
+        import pandas as pd
+
+        vals: dict[str, Any] = {}
+        for key, var in plan:
+            data = data_dct[key]
+            if not var.components:
+                vals[key] = data
+            else:
+                subvars, subvals = var.unpack(data)
+                for subvar, subval in zip(subvars, subvals, strict=True):
+                    vals[subvar.key] = subval
+        df = pd.DataFrame(vals)
+        df.columns = columns
+        return df
+
+    return to_df
+
+
 def records_to_df(
     var_dct: VarDict,
     data_dict_lst: list[dict[str, Any]],
@@ -253,6 +709,12 @@ def records_to_df(
 ) -> pd.DataFrame:
     """Convert Vars and a list of records of data to a pandas DataFrame.
 
+    The records are unpacked column-wise: each key is resolved once and
+    flat per-record values are transposed in one pass rather than
+    re-unpacking every record. Nested or array values fall back to
+    Var.unpack per record, which honors the component axis. Records
+    must share the keys of the first record.
+
     Args:
         var_dct: Dictionary mapping var keys to Var objects.
         data_dict_lst: List of dictionaries mapping var keys to data values.
@@ -260,20 +722,45 @@ def records_to_df(
 
     Returns:
         pd.DataFrame: DataFrame with MultiIndex columns based on Var metadata.
+
+    Raises:
+        ValueError: If no records are provided.
     """
-    var_list = None
-    unpacked = []
-    for data_dct in data_dict_lst:
-        print(data_dct)
-        unpacked_var_dct, subdata_dct = unpack(var_dct, data_dct)
-        if var_list is None:
-            var_list = [unpacked_var_dct[key] for key in subdata_dct]
-        unpacked.append(subdata_dct)
-    if var_list is None:
+    import pandas as pd
+
+    if not data_dict_lst:
         raise ValueError("No data or malformed data provided.")
-    tuples, names = vars_to_multi_index_data(var_list, attrs=attrs)
-    columns = pd.MultiIndex.from_tuples(tuples, names=names)
-    df = pd.DataFrame.from_records(unpacked)
+    vars = VarDict()
+    vals: dict[str, Any] = {}
+    for key in data_dict_lst[0]:
+        var = var_dct[key]
+        rows = [record[key] for record in data_dict_lst]
+        if not var.components:
+            vals[key] = rows
+            vars[key] = var
+            continue
+        subvars = var.component_vars()
+        if all(_is_flat_row(row, len(subvars)) for row in rows):
+            # Flat rows hold one value per component, so a single
+            # transpose matches per-record unpacking for any axis.
+            cols = zip(*rows, strict=True)
+            for subvar, col in zip(subvars, cols, strict=True):
+                vals[subvar.key] = list(col)
+                vars[subvar.key] = subvar
+            continue
+        # Nested or array values depend on the component axis; let
+        # Var.unpack handle each record as before.
+        cols: list[list[Any]] = [[] for _ in subvars]
+        for row in rows:
+            _, subvals = var.unpack(row)
+            for col, subval in zip(cols, subvals, strict=True):
+                col.append(subval)
+        for subvar, col in zip(subvars, cols, strict=True):
+            vals[subvar.key] = col
+            vars[subvar.key] = subvar
+    var_list = [vars[key] for key in vals]
+    columns = vars_to_multi_index(var_list, attrs=attrs)
+    df = pd.DataFrame(vals)
     df.columns = columns
     return df
 
@@ -300,5 +787,6 @@ def vars_from_dict(var_data_dict: dict[str, VarData]) -> dict[str, Var]:
     Returns:
         dict[str, Var]: Dictionary mapping var keys to Var objects.
     """
-    var_dct = {key: Var(**data) for key, data in var_data_dict.items()}
-    return VarDict(var_dct)
+    return VarDict(
+        (key, Var(**data)) for key, data in var_data_dict.items()
+    )
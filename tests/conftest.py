@@ -0,0 +1,70 @@
+"""Shared fixtures for the test suite.
+
+The canonical Var instances used across the test files are immutable,
+so they are built once per session instead of once per test.
+"""
+
+import pytest
+
+from varmeta import Var
+
+
+@pytest.fixture(scope="session")
+def force_xyz() -> Var:
+    """A force Var with x, y, z components along axis 0."""
+    return Var(
+        key="F",
+        name="force",
+        units="N",
+        description="A force",
+        components=("x", "y", "z"),
+    )
+
+
+@pytest.fixture(scope="session")
+def force_xy_axis1() -> Var:
+    """A force Var with x, y components along axis 1."""
+    return Var(
+        key="F",
+        name="force",
+        units="N",
+        description="A force",
+        components=("x", "y"),
+        component_axis=1,
+    )
+
+
+@pytest.fixture(scope="session")
+def insol_var() -> Var:
+    """A plain scalar solar radiation Var."""
+    return Var(
+        key="insol",
+        name="solar_radiation",
+        units="W/m^2",
+        description="Solar radiation at surface",
+        components=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def mass_var() -> Var:
+    """A plain scalar mass Var."""
+    return Var(
+        key="m",
+        name="mass",
+        units="kg",
+        description="Mass of the object",
+        components=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def temperature_var() -> Var:
+    """A plain scalar temperature Var."""
+    return Var(
+        key="temp",
+        name="temperature",
+        units="Celsius",
+        description="Ambient temperature",
+        components=None,
+    )
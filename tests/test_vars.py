@@ -1,17 +1,13 @@
 """Unittests for core module."""
 
-from varmeta.vars import Var
+import pytest
+
+from varmeta.vars import Var, VarDict
 
 
 class TestVar:
-    def test_var_creation(self):
-        var = Var(
-            key="temp",
-            name="temperature",
-            units="Celsius",
-            description="Ambient temperature",
-            components=None,
-        )
+    def test_var_creation(self, temperature_var):
+        var = temperature_var
         assert var.name == "temperature"
         assert var.units == "Celsius"
         assert var.description == "Ambient temperature"
@@ -90,6 +86,27 @@ class TestVar:
         )
         assert var1 != var2
 
+    def test_hash_consistency(self):
+        var1 = Var(
+            key="hum",
+            name="humidity",
+            units="Percent",
+            description="Relative humidity",
+            components=None,
+        )
+        var2 = Var(
+            key="humidity",
+            name="humidity",
+            units="Percent",
+            description="Relative humidity",
+            components=None,
+        )
+        # Equal Vars must hash equally so dict probes can trust the
+        # hash before falling back to field comparison.
+        assert var1 == var2
+        assert hash(var1) == hash(var2)
+        assert var1 == var1
+
     def test_hash_with_components(self):
         var = Var(
             key="vel",
@@ -100,52 +117,67 @@ class TestVar:
         )
         assert hash(var) != 0
 
-    def test_unpack_axis_default(self):
-        force = Var(
-            key="F",
-            name="force",
-            units="N",
-            description="A force",
-            components=("x", "y", "z"),
-        )
+    @pytest.mark.parametrize(
+        "force_fixture,expected_vals,expected_names",
+        [
+            (
+                "force_xyz",
+                [[10, 11], [20, 21], [30, 31]],
+                ["force - x", "force - y", "force - z"],
+            ),
+            (
+                "force_xy_axis1",
+                [[10, 20, 30], [11, 21, 31]],
+                ["force - x", "force - y"],
+            ),
+        ],
+    )
+    def test_unpack_axis(
+        self, request, force_fixture, expected_vals, expected_names
+    ):
+        force = request.getfixturevalue(force_fixture)
         data = [[10, 11], [20, 21], [30, 31]]
         subvars, subvals = force.unpack(data)
-        print(subvars, subvals)
-        assert len(subvals) == 3
-        assert subvals[0] == [10, 11]
-        assert subvars[0].name == "force - x"
-        assert subvals[1] == [20, 21]
-        assert subvars[1].name == "force - y"
-        assert subvals[2] == [30, 31]
-        assert subvars[2].name == "force - z"
+        assert subvals == expected_vals
+        assert [subvar.name for subvar in subvars] == expected_names
 
-    def test_unpack_axis_1(self):
-        force = Var(
-            key="F",
-            name="force",
-            units="N",
-            description="A force",
-            components=("x", "y"),
-            component_axis=1,
-        )
-        data = [[10, 11], [20, 21], [30, 31]]
-        subvars, subvals = force.unpack(data)
-        print(subvars, subvals)
-        assert len(subvals) == 2
-        assert subvals[0] == [10, 20, 30]
-        assert subvars[0].name == "force - x"
-        assert subvals[1] == [11, 21, 31]
-        assert subvars[1].name == "force - y"
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {
+                "key": "F",
+                "name": "force",
+                "units": "N",
+                "description": "A force",
+                "components": ("x", "y", "z"),
+            },
+            {
+                "key": "temp",
+                "name": "temperature",
+                "units": "Celsius",
+                "description": "Ambient temperature",
+                "components": None,
+            },
+            {
+                "key": "v",
+                "name": "velocity",
+                "units": "m/s",
+                "description": "Velocity over time",
+                "components": ("x", "y"),
+                "component_axis": 1,
+                "data_type": "float",
+            },
+        ],
+    )
+    def test_round_trip_dict(self, kwargs):
+        var = Var(**kwargs)
+        assert Var(**var.to_dict()) == var
 
-    def test_round_trip_dict(self):
-        force = Var(
-            key="F",
-            name="force",
-            units="N",
-            description="A force",
-            components=("x", "y", "z"),
-        )
-        dct = force.to_dict()
-        print(dct)
-        new_var = Var(**dct)
-        assert new_var == force
+
+class TestVarDict:
+    def test_copy(self, temperature_var):
+        var_dct = VarDict({"temp": temperature_var})
+        copied = var_dct.copy()
+        assert isinstance(copied, VarDict)
+        assert copied == var_dct
+        assert copied is not var_dct
@@ -1,26 +1,57 @@
 import json
 
+import pytest
+
 from varmeta.vars import Var
 
+_VAR_CASES = [
+    (
+        {
+            "key": "temp",
+            "name": "temperature",
+            "units": "Celsius",
+            "description": "Ambient temperature",
+            "components": None,
+        },
+        {
+            "key": "temp",
+            "name": "temperature",
+            "units": "Celsius",
+            "description": "Ambient temperature",
+            "components": None,
+            "component_axis": 0,
+            "data_type": "object",
+        },
+    ),
+    (
+        {
+            "key": "temp",
+            "name": "temperature",
+            "units": "Celsius",
+            "description": "Ambient temperature",
+            "components": ("x", "y", "z"),
+            "component_axis": 1,
+        },
+        {
+            "key": "temp",
+            "name": "temperature",
+            "units": "Celsius",
+            "description": "Ambient temperature",
+            "components": ("x", "y", "z"),
+            "component_axis": 1,
+            "data_type": "object",
+        },
+    ),
+]
+
 
 class TestVarJson:
-    def test_var_dump(self):
-        var = Var(
-            key="temp",
-            name="temperature",
-            units="Celsius",
-            description="Ambient temperature",
-            components=None,
-        )
-        # Try the dump
-        dump = json.dumps(var.to_dict())
-        print(dump)
-        assert (
-            dump
-            == '{"key": "temp", "name": "temperature", "units": "Celsius", "description": "Ambient temperature", "components": null, "component_axis": 0, "data_type": "object"}'  # NoQA: E501
-        )
+    @pytest.mark.parametrize("var_kwargs,expected", _VAR_CASES)
+    def test_to_dict(self, var_kwargs, expected):
+        var = Var(**var_kwargs)
+        assert var.to_dict() == expected
 
-    def test_var_dump_components(self):
+    def test_dump_round_trip(self):
         var = Var(
             key="temp",
             name="temperature",
@@ -29,10 +60,8 @@ class TestVarJson:
             components=("x", "y", "z"),
             component_axis=1,
         )
-        # Try the dump
-        dump = json.dumps(var.to_dict())
-        print(dump)
-        assert (
-            dump
-            == '{"key": "temp", "name": "temperature", "units": "Celsius", "description": "Ambient temperature", "components": ["x", "y", "z"], "component_axis": 1, "data_type": "object"}'  # NoQA: E501
-        )
+        dct = var.to_dict()
+        loaded = json.loads(json.dumps(dct))
+        # JSON has no tuple type, so components come back as a list.
+        loaded["components"] = tuple(loaded["components"])
+        assert loaded == dct